@@ -173,9 +173,14 @@ class Topk(object):
     def __call__(self, x, file_names=None):
         if file_names is not None:
             assert x.shape[0] == len(file_names)
+        # select the topk of the whole batch at once by partial selection,
+        # then only sort the selected topk scores
+        topk = min(self.topk, x.shape[1])
+        batch_index = np.argpartition(x, -topk, axis=1)[:, -topk:]
         y = []
         for idx, probs in enumerate(x):
-            index = probs.argsort(axis=0)[-self.topk:][::-1].astype("int32")
+            index = batch_index[idx]
+            index = index[np.argsort(probs[index])[::-1]].astype("int32")
             clas_id_list = []
             score_list = []
             label_name_list = []
@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import cv2
 import numpy as np
+import paddle
 
 from paddleclas.deploy.utils import logger, config
 from paddleclas.deploy.utils.predictor import Predictor
@@ -24,11 +27,16 @@ from paddleclas.deploy.python.postprocess import build_postprocess
 
 
 class ClsPredictor(Predictor):
+    # predict() pads the last batch up to batch_size
+    support_cuda_graph = True
+
     def __init__(self, config):
         super().__init__(config["Global"])
 
         self.preprocess_ops = []
         self.postprocess = None
+        # host buffer reused across batches to hold the stacked input
+        self.input_buffer = None
         if "PreProcess" in config:
             if "transform_ops" in config["PreProcess"]:
                 self.preprocess_ops = create_operators(config["PreProcess"][
@@ -85,7 +93,19 @@ class ClsPredictor(Predictor):
         for idx in range(len(images)):
             for ops in self.preprocess_ops:
                 images[idx] = ops(images[idx])
-        image = np.array(images)
+        num_images = len(images)
+        if self.args.get("use_tensorrt", False) and self.args.get(
+                "use_cuda_graph", False):
+            # the captured cuda graph needs a fixed input shape, so pad the
+            # last batch up to batch_size and drop the padded outputs later
+            images = images + [images[-1]] * (
+                self.args.batch_size - num_images)
+        shape = (len(images), ) + images[0].shape
+        dtype = images[0].dtype
+        if self.input_buffer is None or self.input_buffer.shape != shape or \
+                self.input_buffer.dtype != dtype:
+            self.input_buffer = np.empty(shape, dtype=dtype)
+        image = np.stack(images, out=self.input_buffer)
         if self.benchmark:
             self.auto_logger.times.stamp()
 
@@ -97,6 +117,7 @@ class ClsPredictor(Predictor):
             batch_output = self.predictor.run(
                 output_names=[output_names],
                 input_feed={input_names: image})[0]
+        batch_output = batch_output[:num_images]
 
         if self.benchmark:
             self.auto_logger.times.stamp()
@@ -107,15 +128,44 @@ class ClsPredictor(Predictor):
         return batch_output
 
 
+def read_images(image_list, num_workers=4, prefetch=8):
+    """
+    read images in background threads, so that decoding the next images
+    overlaps with inference of the current batch. At most `prefetch` images
+    are read ahead.
+    """
+    with ThreadPoolExecutor(num_workers) as executor:
+        futures = deque()
+        for img_path in image_list:
+            futures.append(executor.submit(cv2.imread, img_path))
+            if len(futures) >= prefetch:
+                yield futures.popleft().result()
+        while futures:
+            yield futures.popleft().result()
+
+
 def main(config):
+    if config["Global"].get("use_gpu", False) and config["Global"].get(
+            "cudnn_exhaustive_search", False):
+        # benchmark all cudnn conv algorithms (winograd included) at the
+        # first run and use the fastest one for each conv. The flag is
+        # process-global, so it is set once here instead of per predictor
+        paddle.set_flags({"FLAGS_cudnn_exhaustive_search": True})
     cls_predictor = ClsPredictor(config)
     image_list = get_image_list(config["Global"]["infer_imgs"])
 
+    batch_size = config["Global"]["batch_size"]
+    num_read_threads = config["Global"].get("num_read_threads", 4)
+    # keep every read thread busy even for a small batch_size
+    imgs = read_images(
+        image_list,
+        num_workers=num_read_threads,
+        prefetch=max(2 * batch_size, num_read_threads))
+
     batch_imgs = []
     batch_names = []
     cnt = 0
-    for idx, img_path in enumerate(image_list):
-        img = cv2.imread(img_path)
+    for idx, (img_path, img) in enumerate(zip(image_list, imgs)):
         if img is None:
             logger.warning(
                 "Image file failed to read and has been skipped. The path: {}".
@@ -127,8 +177,7 @@ def main(config):
             batch_names.append(img_name)
             cnt += 1
 
-        if cnt % config["Global"]["batch_size"] == 0 or (idx + 1
-                                                         ) == len(image_list):
+        if cnt % batch_size == 0 or (idx + 1) == len(image_list):
             if len(batch_imgs) == 0:
                 continue
             batch_results = cls_predictor.predict(batch_imgs)
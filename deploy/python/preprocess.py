@@ -327,6 +327,10 @@ class NormalizeImage(object):
         shape = (3, 1, 1) if self.order == 'chw' else (1, 1, 3)
         self.mean = np.array(mean).reshape(shape).astype('float32')
         self.std = np.array(std).reshape(shape).astype('float32')
+        # fold scale and std so that normalizing is one multiply and one
+        # subtract: (img * scale - mean) / std = img * alpha - beta
+        self.alpha = self.scale / self.std
+        self.beta = self.mean / self.std
 
     def __call__(self, img):
         from PIL import Image
@@ -336,7 +340,8 @@ class NormalizeImage(object):
         assert isinstance(img,
                           np.ndarray), "invalid input 'img' in NormalizeImage"
 
-        img = (img.astype('float32') * self.scale - self.mean) / self.std
+        img = np.multiply(img, self.alpha, dtype='float32')
+        img -= self.beta
 
         if self.channel_num == 4:
             img_h = img.shape[1] if self.order == 'chw' else img.shape[0]
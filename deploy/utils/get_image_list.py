@@ -23,13 +23,13 @@ def get_image_list(img_file):
     if img_file is None or not os.path.exists(img_file):
         raise Exception("not found any img file in {}".format(img_file))
 
-    img_end = ['jpg', 'png', 'jpeg', 'JPEG', 'JPG', 'bmp']
-    if os.path.isfile(img_file) and img_file.split('.')[-1] in img_end:
+    img_end = ('.jpg', '.png', '.jpeg', '.JPEG', '.JPG', '.bmp')
+    if os.path.isfile(img_file) and img_file.endswith(img_end):
         imgs_lists.append(img_file)
     elif os.path.isdir(img_file):
         for root, dirs, files in os.walk(img_file):
             for single_file in files:
-                if single_file.split('.')[-1] in img_end:
+                if single_file.endswith(img_end):
                     imgs_lists.append(os.path.join(root, single_file))
     if len(imgs_lists) == 0:
         raise Exception("not found any img file in {}".format(img_file))
@@ -19,15 +19,32 @@ import shutil
 import cv2
 import numpy as np
 
+import paddle
 from paddle.inference import Config
+from paddle.inference import PrecisionType
 from paddle.inference import create_predictor
 
+from . import logger
+
+
+def paddle_version_at_least(major, minor):
+    # the develop version of paddle is 0.0.0, which supports all the features
+    version = tuple(int(v) for v in paddle.__version__.split(".")[:2])
+    return version == (0, 0) or version >= (major, minor)
+
 
 class Predictor(object):
+    # the captured cuda graph requires a fixed input shape, subclasses that
+    # pad the last batch up to batch_size in predict() can support it
+    support_cuda_graph = False
+
     def __init__(self, args, inference_model_dir=None):
-        # HALF precission predict only work when using tensorrt
+        # HALF precision predict only works when using tensorrt, or gpu
+        # with paddle 2.5 or later
         if args.use_fp16 is True:
-            assert args.use_tensorrt is True
+            assert args.use_tensorrt is True or (
+                args.get("use_gpu", False) and paddle_version_at_least(2, 5)
+            ), "use_fp16 requires use_tensorrt, or use_gpu with paddle 2.5 or later."
         self.args = args
         if self.args.get("use_onnx", False):
             self.predictor, self.config = self.create_onnx_predictor(
@@ -61,7 +78,11 @@ class Predictor(object):
         config = Config(model_file, params_file)
 
         if args.get("use_gpu", False):
-            config.enable_use_gpu(args.gpu_mem, 0)
+            if args.get("use_fp16", False) and not args.use_tensorrt:
+                # run the gpu kernels in half precision without tensorrt
+                config.enable_use_gpu(args.gpu_mem, 0, PrecisionType.Half)
+            else:
+                config.enable_use_gpu(args.gpu_mem, 0)
         elif args.get("use_npu", False):
             config.enable_custom_device('npu')
         elif args.get("use_xpu", False):
@@ -74,6 +95,19 @@ class Predictor(object):
                     # cache 10 different shapes for mkldnn to avoid memory leak
                     config.set_mkldnn_cache_capacity(10)
                 config.enable_mkldnn()
+                if args.get("use_int8", False):
+                    # enable_mkldnn_int8() is only available since paddle 2.4
+                    if hasattr(config, "enable_mkldnn_int8"):
+                        # run the quantized conv/fc ops with oneDNN int8 kernels
+                        config.enable_mkldnn_int8()
+                    else:
+                        logger.warning(
+                            "enable_mkldnn_int8() is not supported by the installed paddle, please upgrade paddle to 2.4 or later. The oneDNN int8 kernels are not enabled."
+                        )
+            elif args.get("use_int8", False):
+                logger.warning(
+                    "use_int8 on cpu requires enable_mkldnn to be True, the quantized model will run in fp32."
+                )
         config.set_cpu_math_library_num_threads(args.cpu_num_threads)
 
         if args.enable_profile:
@@ -87,14 +121,28 @@ class Predictor(object):
             elif args.get("use_fp16", False):
                 precision = Config.Precision.Half
 
+            trt_kwargs = {}
+            if args.get("use_cuda_graph", False):
+                assert self.support_cuda_graph, "use_cuda_graph is only supported for classification inference now, please set use_cuda_graph as False."
+                assert paddle_version_at_least(
+                    2, 5
+                ), "use_cuda_graph requires paddle 2.5 or later, please upgrade paddle or set use_cuda_graph as False."
+                # replay the captured trt engine launches, input shape
+                # should be fixed, e.g. a constant batch_size
+                trt_kwargs["use_cuda_graph"] = True
+
             config.enable_tensorrt_engine(
                 precision_mode=precision,
                 max_batch_size=args.batch_size,
                 workspace_size=1 << 30,
                 min_subgraph_size=30,
-                use_calib_mode=False)
+                use_calib_mode=False,
+                **trt_kwargs)
 
-        config.enable_memory_optim()
+        # memory reuse lowers the footprint but may cost some latency,
+        # it can be turned off for latency-critical deployment
+        if args.get("enable_memory_optim", True):
+            config.enable_memory_optim()
         # use zero copy
         config.switch_use_feed_fetch_ops(False)
         predictor = create_predictor(config)
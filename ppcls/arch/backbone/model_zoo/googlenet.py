@@ -22,8 +22,6 @@ from paddle.nn import Conv2D, BatchNorm, Linear, Dropout
 from paddle.nn import AdaptiveAvgPool2D, MaxPool2D, AvgPool2D
 from paddle.nn.initializer import Uniform
 
-import math
-
 from ....utils.save_load import load_dygraph_pretrain, load_dygraph_pretrain_from_url
 
 MODEL_URLS = {
@@ -82,7 +80,12 @@ class Inception(nn.Layer):
                  name=None,
                  data_format="NCHW"):
         super(Inception, self).__init__()
+        self.is_repped = False
+        self.input_channels = input_channels
         self.data_format = data_format
+        self.channel_axis = 3 if data_format == "NHWC" else 1
+        # output channels of the 1x1 convs which share the block input
+        self.split_sections = [filter1, filter3R, filter5R]
 
         self._conv1 = ConvLayer(
             input_channels,
@@ -125,29 +128,69 @@ class Inception(nn.Layer):
             data_format=data_format)
 
     def forward(self, inputs):
-        conv1 = self._conv1(inputs)
+        if self.is_repped:
+            conv1, conv3r, conv5r = paddle.split(
+                self._conv1x1(inputs),
+                self.split_sections,
+                axis=self.channel_axis)
+        else:
+            conv1 = self._conv1(inputs)
+            conv3r = self._conv3r(inputs)
+            conv5r = self._conv5r(inputs)
 
-        conv3r = self._conv3r(inputs)
         conv3 = self._conv3(conv3r)
-
-        conv5r = self._conv5r(inputs)
         conv5 = self._conv5(conv5r)
 
         pool = self._pool(inputs)
         convprj = self._convprj(pool)
 
-        if self.data_format == "NHWC":
-            cat = paddle.concat([conv1, conv3, conv5, convprj], axis=3)
-        else:
-            cat = paddle.concat([conv1, conv3, conv5, convprj], axis=1)
+        cat = paddle.concat(
+            [conv1, conv3, conv5, convprj], axis=self.channel_axis)
         cat = F.relu(cat)
         return cat
 
+    def re_parameterize(self):
+        """
+        merge the 1x1, 3x3_reduce and 5x5_reduce convs into one 1x1 conv,
+        so that the block input is read only once by them
+        """
+        if not hasattr(self, "_conv1x1"):
+            self._conv1x1 = Conv2D(
+                in_channels=self.input_channels,
+                out_channels=sum(self.split_sections),
+                kernel_size=1,
+                bias_attr=False,
+                data_format=self.data_format)
+        kernel = paddle.concat(
+            [
+                self._conv1._conv.weight, self._conv3r._conv.weight,
+                self._conv5r._conv.weight
+            ],
+            axis=0)
+        self._conv1x1.weight.set_value(kernel)
+        self.is_repped = True
+
 
 class GoogLeNetDY(nn.Layer):
-    def __init__(self, class_num=1000, data_format="NCHW"):
+    def __init__(self,
+                 class_num=1000,
+                 data_format="NCHW",
+                 input_data_format="NCHW"):
         super(GoogLeNetDY, self).__init__()
+        assert data_format in [
+            "NCHW", "NHWC"
+        ], "data_format should be in [\"NCHW\", \"NHWC\"] but got {}".format(
+            data_format)
+        assert input_data_format in [
+            "NCHW", "NHWC"
+        ], "input_data_format should be in [\"NCHW\", \"NHWC\"] but got {}".format(
+            input_data_format)
+        assert input_data_format == "NCHW" or data_format == "NHWC", \
+            "NHWC input is only supported when data_format is NHWC"
         self.data_format = data_format
+        # when the images are fed channels-last already (e.g. preprocess
+        # without ToCHWImage), no transpose is needed in NHWC mode
+        self.input_data_format = input_data_format
         self._conv = ConvLayer(
             3, 64, 7, 2, name="conv1", data_format=data_format)
         self._pool = MaxPool2D(
@@ -300,7 +343,7 @@ class GoogLeNetDY(nn.Layer):
             bias_attr=ParamAttr(name="out2_offset"))
 
     def forward(self, inputs):
-        if self.data_format == "NHWC":
+        if self.data_format == "NHWC" and self.input_data_format == "NCHW":
             inputs = paddle.transpose(inputs, [0, 2, 3, 1])
             inputs.stop_gradient = True
         x = self._conv(inputs)
@@ -328,6 +371,10 @@ class GoogLeNetDY(nn.Layer):
         x = self.flatten(x)
         out = self._fc_out(x)
 
+        # the auxiliary classifiers are only used for training
+        if not self.training:
+            return [out]
+
         x = self._pool_o1(ince4a)
         x = self._conv_o1(x)
         x = self.flatten(x)
@@ -54,10 +54,12 @@ class Topk(object):
             assert x.shape[0] == len(file_names)
         x = F.softmax(x, axis=-1)
         x = x.numpy()
+        topk = min(self.topk, x.shape[-1])
         y = []
         for idx, probs in enumerate(x):
-            index = probs.argsort(axis=0)[-self.topk:][::-1].astype(
-                "int32")
+            # partial selection of the topk, then sort only the topk scores
+            index = np.argpartition(probs, -topk)[-topk:]
+            index = index[np.argsort(probs[index])[::-1]].astype("int32")
             clas_id_list = []
             score_list = []
             label_name_list = []
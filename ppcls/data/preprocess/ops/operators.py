@@ -169,31 +169,74 @@ class DecodeImage(object):
         self.to_rgb = to_rgb  # only enabled when to_np is True
         self.channel_first = channel_first  # only enabled when to_np is True
 
-        if backend.lower() not in ["cv2", "pil"]:
+        if backend.lower() not in ["cv2", "pil", "turbojpeg"]:
             logger.warning(
-                f"The backend of DecodeImage only support \"cv2\" or \"PIL\". \"f{backend}\" is unavailable. Use \"cv2\" instead."
+                f"The backend of DecodeImage only support \"cv2\", \"PIL\" or \"turbojpeg\". \"f{backend}\" is unavailable. Use \"cv2\" instead."
             )
             backend = "cv2"
         self.backend = backend.lower()
 
+        # the libjpeg-turbo decoder is created lazily in __call__, because
+        # the ctypes based object can not be pickled to dataloader workers
+        # started by spawn
+        self.turbojpeg = None
+        if self.backend == "turbojpeg":
+            try:
+                from turbojpeg import TurboJPEG
+                # check that the libjpeg-turbo library can be loaded
+                TurboJPEG()
+            except (ImportError, OSError, RuntimeError) as ex:
+                # ImportError: PyTurboJPEG is not installed, OSError and
+                # RuntimeError: the libjpeg-turbo library can not be loaded
+                logger.warning(
+                    f"Failed to load turbojpeg ({ex}), please install it by `pip install PyTurboJPEG`. Use \"cv2\" instead."
+                )
+                self.backend = "cv2"
+
         if not to_np:
             logger.warning(
                 f"\"to_rgb\" and \"channel_first\" are only enabled when to_np is True. \"to_np\" is now {to_np}."
             )
 
+    def _turbojpeg_decode(self, img):
+        """
+        decode jpeg bytes to BGR by turbojpeg, return None for the images
+        which should be decoded by cv2 to get the same result
+        """
+        if img[:2] != b"\xff\xd8":
+            return None
+        try:
+            # turbojpeg ignores the exif orientation, while cv2 applies it
+            if Image.open(io.BytesIO(img)).getexif().get(0x0112, 1) != 1:
+                return None
+            if self.turbojpeg is None:
+                from turbojpeg import TurboJPEG, TJPF_BGR
+                self.turbojpeg = TurboJPEG()
+                self.turbojpeg_format = TJPF_BGR
+            return self.turbojpeg.decode(
+                img, pixel_format=self.turbojpeg_format)
+        except OSError:
+            # e.g. CMYK/YCCK jpeg can not be decoded to BGR by turbojpeg
+            return None
+
     @format_data
     def __call__(self, img):
         if isinstance(img, Image.Image):
             assert self.backend == "pil", "invalid input 'img' in DecodeImage"
         elif isinstance(img, np.ndarray):
-            assert self.backend == "cv2", "invalid input 'img' in DecodeImage"
+            assert self.backend in ["cv2", "turbojpeg"
+                                    ], "invalid input 'img' in DecodeImage"
         elif isinstance(img, bytes):
             if self.backend == "pil":
                 data = io.BytesIO(img)
                 img = Image.open(data).convert("RGB")
             else:
-                data = np.frombuffer(img, dtype="uint8")
-                img = cv2.imdecode(data, 1)
+                data = None
+                if self.backend == "turbojpeg":
+                    data = self._turbojpeg_decode(img)
+                if data is None:
+                    data = cv2.imdecode(np.frombuffer(img, dtype="uint8"), 1)
+                img = data
         else:
             raise ValueError("invalid input 'img' in DecodeImage")
 
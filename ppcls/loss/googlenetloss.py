@@ -27,6 +27,15 @@ class GoogLeNetLoss(nn.Layer):
                 epsilon >= 1), "googlenet is not support label_smooth"
 
     def forward(self, inputs, label):
+        # googlenet only outputs the main logits in eval mode
+        if len(inputs) == 1:
+            input0 = inputs[0]
+            if isinstance(input0, dict):
+                input0 = input0["logits"]
+            loss = F.cross_entropy(input0, label=label, soft_label=False)
+            loss = loss.mean()
+            return {"GooleNetLoss": loss}
+
         input0, input1, input2 = inputs
         if isinstance(input0, dict):
             input0 = input0["logits"]